@@ -1,19 +1,57 @@
+from typing import TYPE_CHECKING
+
 from agora.common.core import Conversation, Protocol, Suitability
 from agora.sender.task_schema import TaskSchema, TaskSchemaLike
 from agora.common.toolformers.base import Toolformer, Tool, ToolLike
-from agora.sender import TaskSchemaGenerator, Sender, SenderMemory
-from agora.receiver import Receiver, ReceiverMemory, ReceiverServer
-
-import agora.common.core as core
-import agora.common.errors as errors
-import agora.common.executor as executor
-import agora.common.function_schema as function_schema
-import agora.common.interpreters as interpreters
-import agora.common.memory as memory
-import agora.common.storage as storage
-import agora.common.toolformers as toolformers
-
-import agora.common as common
-import agora.receiver as receiver
-import agora.sender as sender
-import agora.utils as utils
\ No newline at end of file
+from agora.utils import lazy_module_getattr
+
+# Heavier components (and their optional backends) are only imported when first accessed
+_LAZY_ATTRIBUTES = {
+    'TaskSchemaGenerator': ('agora.sender', 'TaskSchemaGenerator'),
+    'Sender': ('agora.sender', 'Sender'),
+    'SenderMemory': ('agora.sender', 'SenderMemory'),
+    'Receiver': ('agora.receiver', 'Receiver'),
+    'ReceiverMemory': ('agora.receiver', 'ReceiverMemory'),
+    'ReceiverServer': ('agora.receiver', 'ReceiverServer'),
+
+    'core': ('agora.common.core', None),
+    'errors': ('agora.common.errors', None),
+    'executor': ('agora.common.executor', None),
+    'function_schema': ('agora.common.function_schema', None),
+    'interpreters': ('agora.common.interpreters', None),
+    'memory': ('agora.common.memory', None),
+    'storage': ('agora.common.storage', None),
+    'toolformers': ('agora.common.toolformers', None),
+
+    'common': ('agora.common', None),
+    'receiver': ('agora.receiver', None),
+    'sender': ('agora.sender', None),
+    'utils': ('agora.utils', None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_ATTRIBUTES)
+
+__all__ = [
+    'Conversation', 'Protocol', 'Suitability',
+    'TaskSchema', 'TaskSchemaLike',
+    'Toolformer', 'Tool', 'ToolLike',
+    *_LAZY_ATTRIBUTES
+]
+
+if TYPE_CHECKING:
+    from agora.sender import TaskSchemaGenerator, Sender, SenderMemory
+    from agora.receiver import Receiver, ReceiverMemory, ReceiverServer
+
+    import agora.common.core as core
+    import agora.common.errors as errors
+    import agora.common.executor as executor
+    import agora.common.function_schema as function_schema
+    import agora.common.interpreters as interpreters
+    import agora.common.memory as memory
+    import agora.common.storage as storage
+    import agora.common.toolformers as toolformers
+
+    import agora.common as common
+    import agora.receiver as receiver
+    import agora.sender as sender
+    import agora.utils as utils
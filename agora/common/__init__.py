@@ -1,8 +1,29 @@
-import agora.common.core as core
-import agora.common.errors as errors
-import agora.common.executor as executor
-import agora.common.function_schema as function_schema
-import agora.common.interpreters as interpreters
-import agora.common.memory as memory
-import agora.common.storage as storage
-import agora.common.toolformers as toolformers
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from agora.utils import lazy_module_getattr
+
+# Submodules are only imported when first accessed
+_LAZY_ATTRIBUTES = {
+    'core': ('agora.common.core', None),
+    'errors': ('agora.common.errors', None),
+    'executor': ('agora.common.executor', None),
+    'function_schema': ('agora.common.function_schema', None),
+    'interpreters': ('agora.common.interpreters', None),
+    'memory': ('agora.common.memory', None),
+    'storage': ('agora.common.storage', None),
+    'toolformers': ('agora.common.toolformers', None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_ATTRIBUTES)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    import agora.common.core as core
+    import agora.common.errors as errors
+    import agora.common.executor as executor
+    import agora.common.function_schema as function_schema
+    import agora.common.interpreters as interpreters
+    import agora.common.memory as memory
+    import agora.common.storage as storage
+    import agora.common.toolformers as toolformers
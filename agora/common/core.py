@@ -1,10 +1,34 @@
 from abc import ABC, abstractmethod
+import asyncio
 from enum import Enum
+import os
+import threading
 from types import TracebackType
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+import weakref
 
 from agora.utils import compute_hash, extract_metadata
 
+# Maximum number of conversation calls that can be awaited concurrently on the same event loop.
+# Can be lowered to stay within the rate limits of the underlying provider.
+MAX_CONCURRENT_CALLS = int(os.environ.get('AGORA_MAX_CONCURRENT_CALLS', '8'))
+
+_call_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+
+def get_call_semaphore() -> asyncio.Semaphore:
+    """
+    Returns the semaphore that limits concurrent conversation calls on the running event loop.
+
+    Returns:
+        asyncio.Semaphore: The semaphore associated with the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    if loop not in _call_semaphores:
+        _call_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+    return _call_semaphores[loop]
+
 class Suitability(str, Enum):
     """
     Enumeration of protocol suitability statuses.
@@ -21,19 +45,132 @@ class Conversation(ABC):
     """
 
     @abstractmethod
-    def __call__(self, message: str, print_output: bool = True) -> Any:
+    def __call__(self, message: str, print_output: bool = False) -> Any:
         """
         Processes a message within the conversation.
 
         Args:
             message (str): The message to process.
-            print_output (bool): Whether to print the response.
+            print_output (bool): Whether to print the response. Defaults to False.
 
         Returns:
             Any: The response generated by processing the message.
         """
         pass
 
+    async def acall(self, message: str, print_output: bool = False) -> Any:
+        """
+        Asynchronously processes a message within the conversation.
+
+        The default implementation runs the blocking call in a worker thread, so that several
+        conversations can be awaited concurrently. The number of concurrent calls is capped
+        by AGORA_MAX_CONCURRENT_CALLS.
+
+        Args:
+            message (str): The message to process.
+            print_output (bool): Whether to print the response. Defaults to False.
+
+        Returns:
+            Any: The response generated by processing the message.
+        """
+        async with get_call_semaphore():
+            return await asyncio.to_thread(self, message, print_output)
+
+    def stream(self, message: str) -> Iterator[str]:
+        """
+        Processes a message within the conversation, yielding the response in chunks.
+
+        The default implementation yields the whole response as a single chunk. Conversations backed by
+        a streaming model should override it so that closing the generator early stops the generation,
+        while still recording the partial response in the conversation history.
+
+        Args:
+            message (str): The message to process.
+
+        Yields:
+            str: The chunks of the response.
+        """
+        yield self(message, print_output=False)
+
+    def stream_chat(self, message: str, stop_on: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Streams the response to a message, stopping as soon as one of the stop strings has been generated.
+
+        The stop strings are matched case-insensitively and are included in the output.
+
+        Args:
+            message (str): The message to process.
+            stop_on (Optional[List[str]]): Strings that end the response as soon as they appear. Defaults to None.
+
+        Yields:
+            str: The chunks of the response.
+        """
+        stop_on = [stop.lower() for stop in stop_on or []]
+        window_size = max((len(stop) for stop in stop_on), default=0)
+
+        chunks = self.stream(message)
+        # Only the end of the text generated so far needs to be checked for stop strings that span several chunks
+        tail = ''
+
+        try:
+            for chunk in chunks:
+                yield chunk
+
+                if stop_on:
+                    window = tail + chunk.lower()
+
+                    if any(stop in window for stop in stop_on):
+                        return
+
+                    tail = window[-window_size:]
+        finally:
+            chunks.close()
+
+    async def astream_chat(self, message: str, stop_on: Optional[List[str]] = None) -> str:
+        """
+        Asynchronously processes a message, stopping as soon as one of the stop strings has been generated.
+
+        The response is streamed with stream_chat in a worker thread. The number of concurrent calls is capped
+        by AGORA_MAX_CONCURRENT_CALLS.
+
+        If the awaiting task is cancelled, the stream is closed after the next chunk, which stops the generation
+        for conversations that support streaming. The call keeps its concurrency slot until the worker thread has exited.
+
+        Args:
+            message (str): The message to process.
+            stop_on (Optional[List[str]]): Strings that end the response as soon as they appear. Defaults to None.
+
+        Returns:
+            str: The response, up to and including the first stop string.
+        """
+        cancelled = threading.Event()
+
+        def run() -> str:
+            chunks = self.stream_chat(message, stop_on=stop_on)
+            parts = []
+
+            try:
+                for chunk in chunks:
+                    parts.append(chunk)
+
+                    if cancelled.is_set():
+                        break
+            finally:
+                chunks.close()
+
+            return ''.join(parts)
+
+        async with get_call_semaphore():
+            worker = asyncio.ensure_future(asyncio.to_thread(run))
+
+            try:
+                return await asyncio.shield(worker)
+            except asyncio.CancelledError:
+                cancelled.set()
+                # A running thread cannot be interrupted: wait for it to exit before releasing the slot
+                await asyncio.wait([worker])
+                raise
+
     def close(self) -> None:
         """
         Closes the conversation.
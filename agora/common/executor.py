@@ -1,10 +1,28 @@
 from abc import abstractmethod
+import functools
 import importlib
+import logging
+from types import CodeType
 from typing import Any, List
 
 from agora.common.toolformers.base import Tool, ToolLike, Conversation
 from agora.common.interpreters.restricted import execute_restricted
 
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=128)
+def compile_cached(code: str, filename: str) -> CodeType:
+    """Compiles code, reusing the code object if the same code was already compiled.
+
+    Args:
+        code (str): The code to compile.
+        filename (str): The filename reported in tracebacks.
+
+    Returns:
+        CodeType: The compiled code object.
+    """
+    return compile(code, filename, 'exec')
+
 class Executor:
     """Abstract base class for executors that run protocol implementations."""
 
@@ -79,7 +97,8 @@ class UnsafeExecutor(Executor):
         spec = importlib.util.spec_from_loader(protocol_id, loader=None)
         loaded_module = importlib.util.module_from_spec(spec)
 
-        exec(code, loaded_module.__dict__)
+        # The code is compiled once and then executed in a fresh module on every call
+        exec(compile_cached(code, f'<agora:{protocol_id}>'), loaded_module.__dict__)
 
         for tool in tools:
             loaded_module.__dict__[tool.name] = tool.func
@@ -143,12 +162,12 @@ class ExecutorConversation(Conversation):
         self.tools = [Tool.from_toollike(tool) for tool in tools]
         self.memory = {} if multiround else None
     
-    def __call__(self, message: str, print_output: bool = True) -> Any:
+    def __call__(self, message: str, print_output: bool = False) -> Any:
         """Processes a message by executing the implementation code.
 
         Args:
             message (str): The input message for the conversation.
-            print_output (bool): Whether to print the result.
+            print_output (bool): Whether to print the result. Defaults to False.
 
         Returns:
             Any: The output from the execution of the code.
@@ -159,6 +178,8 @@ class ExecutorConversation(Conversation):
         else:
             response = self.executor(self.protocol_id, self.code, self.tools, [message], {})
 
+        logger.debug('Executor response: %s', response)
+
         if print_output:
             print(response)
         
@@ -6,8 +6,6 @@ import re
 import types
 from typing import Callable, Dict, Optional, Tuple
 
-import langchain.tools.base
-
 DEFAULT_KNOWN_TYPES = {
     'int': int,
     'str': str,
@@ -181,6 +179,9 @@ def schema_from_function(func: Callable, strict: bool = False, known_types: dict
     copied_function.__annotations__ = func.__annotations__
     copied_function.__doc__ = copied_function.__doc__.replace('Arguments:\n', 'Args:\n').replace('Parameters:\n', 'Args:\n').replace('Output:\n', 'Returns:\n')
 
+    # Imported here, since langchain is slow to import and only needed to parse functions
+    import langchain.tools.base
+
     parsed_schema = langchain.tools.base.create_schema_from_function(func_name, copied_function, parse_docstring=True).model_json_schema()
 
     parsed_schema = {
@@ -237,29 +238,29 @@ def generate_docstring(description: str, params: Optional[Dict[str, Tuple[Option
     Returns:
         str: The generated docstring.
     """
-    docstring = description
+    parts = [description]
 
     if params:
-        docstring += '\n\nArgs:'
+        parts.append('\n\nArgs:')
         for param_name, (param_type, param_description) in params.items():
-            docstring += f'\n  {param_name}'
+            parts.append(f'\n  {param_name}')
 
             if param_type is not None:
-                docstring += f' ({param_type.__name__})'
+                parts.append(f' ({param_type.__name__})')
 
             if param_description:
-                docstring += f': {param_description}'
+                parts.append(f': {param_description}')
 
     if returns:
         return_type, return_description = returns
-        docstring += f'\n\nReturns:\n  '
+        parts.append('\n\nReturns:\n  ')
 
         if return_type:
-            docstring += f'{return_type.__name__}'
+            parts.append(return_type.__name__)
         if return_description:
-            docstring += f': {return_description}'
+            parts.append(f': {return_description}')
 
-    return docstring
+    return ''.join(parts)
 
 def set_params_and_annotations(name: str, docstring: str, params: Dict[str, Tuple[Optional[type], Optional[str]]], return_type: Optional[type]) -> Callable:
     """Decorator to set parameters and annotations on a function based on the given schema data.
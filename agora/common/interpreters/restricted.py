@@ -1,4 +1,5 @@
-import random
+import functools
+from types import CodeType
 from typing import Any, Optional, List
 
 from RestrictedPython import compile_restricted, safe_builtins, limited_builtins, utility_builtins
@@ -6,6 +7,18 @@ from RestrictedPython.Guards import guarded_iter_unpack_sequence, guarded_unpack
 
 from agora.common.errors import ExecutionError
 
+@functools.lru_cache(maxsize=128)
+def compile_restricted_cached(code: str) -> CodeType:
+    """Compiles code with RestrictedPython, reusing the code object if the same code was already compiled.
+
+    Args:
+        code (str): The code to compile.
+
+    Returns:
+        CodeType: The compiled code object.
+    """
+    return compile_restricted(code, '<string>', 'exec')
+
 def execute_restricted(
     code: str,
     extra_globals: Optional[dict] = None,
@@ -28,24 +41,15 @@ def execute_restricted(
         Any: The result of the executed function.
 
     Raises:
-        ExecutionError: If an unsupported import is attempted or multiple results are registered.
+        ExecutionError: If an unsupported import is attempted or the function is not defined.
     """
     extra_globals = extra_globals or {}
     supported_imports = supported_imports or []
     input_args = input_args or []
     input_kwargs = input_kwargs or {}
-    
-    register_function_name = 'register_' + str(random.randint(0, 1000000))    
-    get_parameters_name = 'get_parameters_' + str(random.randint(0, 1000000))
 
-    def get_parameters():
-        return input_args, input_kwargs
-    
-    code += f'''
-input_args, input_kwargs = {get_parameters_name}()
-{register_function_name}({function_name}(*input_args, **input_kwargs))'''
-
-    restricted_code = compile_restricted(code, '<string>', 'exec')
+    # The code is compiled once and then executed in fresh globals on every call
+    restricted_code = compile_restricted_cached(code)
 
     _SAFE_MODULES = frozenset(supported_imports)
 
@@ -54,15 +58,6 @@ input_args, input_kwargs = {get_parameters_name}()
             raise ExecutionError(f"Unsupported import {name!r}")
         return __import__(name, *args, **kwargs)
 
-    result = None
-    def register_result(x):
-        nonlocal result
-
-        if result is not None:
-            raise ExecutionError('Only one result can be registered')
-
-        result = x
-
     restricted_globals =  {
         '__builtins__': {
             **safe_builtins,
@@ -77,8 +72,6 @@ input_args, input_kwargs = {get_parameters_name}()
         '_apply_': lambda f, *args, **kwargs: f(*args, **kwargs),
         '_getitem_': lambda obj, key: obj[key],
         '_write_': full_write_guard,
-        get_parameters_name: get_parameters,
-        register_function_name: register_result,
         'map': map,
         'list': list,
         'dict': dict,
@@ -86,4 +79,7 @@ input_args, input_kwargs = {get_parameters_name}()
     }
     exec(restricted_code, restricted_globals)
 
-    return result
\ No newline at end of file
+    if function_name not in restricted_globals:
+        raise ExecutionError(f'Function {function_name!r} is not defined')
+
+    return restricted_globals[function_name](*input_args, **input_kwargs)
\ No newline at end of file
@@ -1,3 +1,20 @@
+from typing import TYPE_CHECKING
+
 from agora.common.toolformers.base import Toolformer, Tool, ToolLike
-from agora.common.toolformers.camel import CamelConversation, CamelToolformer
-from agora.common.toolformers.langchain import LangChainToolformer, LangChainToolformer
\ No newline at end of file
+from agora.utils import lazy_module_getattr
+
+# Backends pull in their (optional) third-party libraries, so they are only imported when first accessed
+_LAZY_ATTRIBUTES = {
+    'CamelConversation': ('agora.common.toolformers.camel', 'CamelConversation'),
+    'CamelToolformer': ('agora.common.toolformers.camel', 'CamelToolformer'),
+    'LangChainConversation': ('agora.common.toolformers.langchain', 'LangChainConversation'),
+    'LangChainToolformer': ('agora.common.toolformers.langchain', 'LangChainToolformer'),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_ATTRIBUTES)
+
+__all__ = ['Toolformer', 'Tool', 'ToolLike', *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from agora.common.toolformers.camel import CamelConversation, CamelToolformer
+    from agora.common.toolformers.langchain import LangChainConversation, LangChainToolformer
@@ -1,13 +1,43 @@
 from abc import ABC, abstractmethod
+import functools
 import json
 from typing import Callable, List, Optional, TypeAlias
 
 from agora.common.core import Conversation
 from agora.common.function_schema import DEFAULT_KNOWN_TYPES, PYTHON_TYPE_TO_JSON_SCHEMA_TYPE, schema_from_function, generate_docstring, set_params_and_annotations
 
+JSON_SCHEMA_TYPE_TO_PYTHON_TYPE = {v: k for k, v in PYTHON_TYPE_TO_JSON_SCHEMA_TYPE.items()}
+
+def _parse_schema(schema: dict, schema_prefix: str) -> tuple:
+    """Convert a JSON schema into a Python type and a description.
+
+    Object schemas cannot be expressed as a Python type, so their full schema is appended to the description.
+
+    Args:
+        schema (dict): The JSON schema.
+        schema_prefix (str): The text that introduces the schema in the description.
+
+    Returns:
+        tuple: The Python type and the description.
+    """
+    description = schema.get('description', '')
+
+    if schema['type'] == 'object':
+        description = description.strip()
+
+        if description and not description.endswith('.'):
+            description += '.'
+
+        description = (description + schema_prefix + json.dumps(schema)).strip()
+
+    return (JSON_SCHEMA_TYPE_TO_PYTHON_TYPE[schema['type']], description)
 
 class Tool:
-    """Represents a tool with a name, description, argument schema, return schema, and a callable function."""
+    """Represents a tool with a name, description, argument schema, return schema, and a callable function.
+
+    The serialized forms of the tool (schemas, docstring, documented Python) are computed once and memoized,
+    so a Tool should not be modified after construction.
+    """
 
     def __init__(
         self,
@@ -32,7 +62,7 @@ class Tool:
         self.return_schema = return_schema
         self.func = func
 
-    @property
+    @functools.cached_property
     def openai_schema(self) -> dict:
         """Returns the OpenAI-compatible schema of the tool.
 
@@ -141,59 +171,31 @@ class Tool:
         else:
             raise ValueError("Tool-like object must be either a Tool or a callable")
 
-    @property
+    @functools.cached_property
     def _args_schema_parsed(self) -> dict:
         """Parse the argument schema into a structured format.
 
         Returns:
             dict: A dictionary mapping argument names to their types and descriptions.
         """
-        inverted_types = {v: k for k, v in PYTHON_TYPE_TO_JSON_SCHEMA_TYPE.items()}
-        params = {}
-
-        for arg_name, arg_schema in self.args_schema['properties'].items():
-            arg_type = inverted_types[arg_schema['type']]
-            arg_description = arg_schema.get('description', '')
-
-            if arg_schema['type'] == 'object':
-                arg_description = arg_description.strip()
-
-                if arg_description and not arg_description.endswith('.'):
-                    arg_description += '.'
-
-                arg_description += ' Schema:' + json.dumps(arg_schema)
-                arg_description = arg_description.strip()
-
-            params[arg_name] = (arg_type, arg_description)
-
-        return params
+        return {
+            arg_name: _parse_schema(arg_schema, ' Schema:')
+            for arg_name, arg_schema in self.args_schema['properties'].items()
+        }
 
-    @property
+    @functools.cached_property
     def _return_schema_parsed(self) -> Optional[tuple]:
         """Parse the return schema into a structured format.
 
         Returns:
             Optional[tuple]: A tuple containing the return type and its description, or None if no return schema is present.
         """
-        inverted_types = {v: k for k, v in PYTHON_TYPE_TO_JSON_SCHEMA_TYPE.items()}
         if self.return_schema:
-            return_type = inverted_types[self.return_schema['type']]
-
-            return_description = self.return_schema.get('description', '')
-
-            if self.return_schema['type'] == 'object':
-                return_description = return_description.strip()
-                if return_description and not return_description.endswith('.'):
-                    return_description += '.'
-
-                return_description += ' Schema: ' + json.dumps(self.return_schema)
-                return_description = return_description.strip()
-
-            return (return_type, return_description)
+            return _parse_schema(self.return_schema, ' Schema: ')
 
         return None
 
-    @property
+    @functools.cached_property
     def docstring(self) -> str:
         """Generate a docstring for the tool based on its description and schemas.
 
@@ -216,22 +218,22 @@ class Tool:
         Returns:
             str: The Python function code as a string with documentation.
         """
-        inverted_types = {v: k for k, v in PYTHON_TYPE_TO_JSON_SCHEMA_TYPE.items()}
+        return self._documented_python
 
-        s = f'def {self.name}('
+    @functools.cached_property
+    def _documented_python(self) -> str:
+        """Build the documented Python function exported by as_documented_python.
 
+        Returns:
+            str: The Python function code as a string with documentation.
+        """
         signature_args = []
 
         for arg_name, arg_schema in self.args_schema['properties'].items():
-            arg_type = inverted_types[arg_schema['type']].__name__
+            arg_type = JSON_SCHEMA_TYPE_TO_PYTHON_TYPE[arg_schema['type']].__name__
             signature_args.append(f'{arg_name}: {arg_type}')
 
-        s += ', '.join(signature_args)
-        s += '):\n'
-
-        s += self.docstring
-
-        return s
+        return ''.join([f'def {self.name}(', ', '.join(signature_args), '):\n', self.docstring])
 
     def as_annotated_function(self) -> Callable:
         """Return the tool as an annotated function.
@@ -254,6 +256,17 @@ ToolLike: TypeAlias = Callable | Tool
 class Toolformer(ABC):
     """Abstract base class for Toolformers, which manage conversations with tools."""
 
+    @property
+    def name(self) -> str:
+        """Get the name of the Toolformer, which identifies the underlying model (e.g. in caches).
+
+        Subclasses should override it to include the model. Defaults to the name of the class.
+
+        Returns:
+            str: The name of the Toolformer.
+        """
+        return type(self).__name__
+
     @abstractmethod
     def new_conversation(self, prompt: str, tools: List[ToolLike], category: Optional[str] = None) -> Conversation:
         """Starts a new conversation with the given prompt and tools.
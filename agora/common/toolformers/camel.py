@@ -1,4 +1,7 @@
-from typing import List, Optional, TYPE_CHECKING
+from collections import OrderedDict
+import logging
+from typing import List, Optional, Tuple, TYPE_CHECKING
+import weakref
 
 from agora.common.toolformers.base import Conversation, Toolformer, Tool, ToolLike
 
@@ -19,6 +22,25 @@ try:
 except ImportError as e:
     CAMEL_IMPORT_ERROR = e
 
+logger = logging.getLogger(__name__)
+
+# Camel wrappers of tools, built once per Tool
+_function_tools: 'weakref.WeakKeyDictionary[Tool, camel.toolkits.function_tool.FunctionTool]' = weakref.WeakKeyDictionary()
+
+def _get_function_tool(tool: Tool) -> 'camel.toolkits.function_tool.FunctionTool':
+    """Get the Camel FunctionTool wrapping a Tool, creating it on first use.
+
+    Args:
+        tool (Tool): The tool to wrap.
+
+    Returns:
+        FunctionTool: The Camel wrapper of the tool.
+    """
+    if tool not in _function_tools:
+        _function_tools[tool] = camel.toolkits.function_tool.FunctionTool(tool.func, openai_tool_schema=tool.openai_schema)
+
+    return _function_tools[tool]
+
 class CamelConversation(Conversation):
     """Handles conversations using the Camel AI Toolformer."""
 
@@ -41,12 +63,12 @@ class CamelConversation(Conversation):
         self.agent = agent
         self.category = category
     
-    def __call__(self, message: str, print_output: bool = True) -> str:
+    def __call__(self, message: str, print_output: bool = False) -> str:
         """Process a message within the conversation and return the response.
 
         Args:
             message (str): The message to process.
-            print_output (bool, optional): Whether to print the response. Defaults to True.
+            print_output (bool, optional): Whether to print the response. Defaults to False.
 
         Returns:
             str: The response from the conversation.
@@ -57,6 +79,8 @@ class CamelConversation(Conversation):
 
         reply = response.msg.content
 
+        logger.debug('Camel reply: %s', reply)
+
         if print_output:
             print(reply)
         
@@ -65,7 +89,7 @@ class CamelConversation(Conversation):
 class CamelToolformer(Toolformer):
     """Toolformer implementation using the Camel AI framework."""
 
-    def __init__(self, model_platform: 'camel.types.ModelPlatformType', model_type: 'camel.types.ModelType', model_config_dict: Optional[dict] = None, name: Optional[str] = None) -> None:
+    def __init__(self, model_platform: 'camel.types.ModelPlatformType', model_type: 'camel.types.ModelType', model_config_dict: Optional[dict] = None, name: Optional[str] = None, tool_cache_size: int = 32) -> None:
         """Initialize the CamelToolformer with model details.
 
         Args:
@@ -73,6 +97,7 @@ class CamelToolformer(Toolformer):
             model_type (ModelPlatformType): The type of the model (e.g. "gpt-4o").
             model_config_dict (dict, optional): Configuration dictionary for the model. Defaults to None (empty dict).
             name (Optional[str], optional): Optional name for the Toolformer. Defaults to None.
+            tool_cache_size (int, optional): Maximum number of tool sets whose Camel wrappers are kept. Defaults to 32.
 
         Raises:
             ImportError: If camel-ai is not available.
@@ -88,6 +113,9 @@ class CamelToolformer(Toolformer):
         self.model_type = model_type
         self.model_config_dict = model_config_dict
         self._name = name
+        self._model = None
+        self.tool_cache_size = tool_cache_size
+        self._function_tool_lists: 'OrderedDict[Tuple[Tool, ...], List[camel.toolkits.function_tool.FunctionTool]]' = OrderedDict()
 
     @property
     def name(self) -> str:
@@ -101,6 +129,42 @@ class CamelToolformer(Toolformer):
         else:
             return self._name
 
+    def _create_model(self) -> 'camel.models.BaseModelBackend':
+        """Create a new model backend with the Toolformer's configuration.
+
+        Returns:
+            BaseModelBackend: The model backend.
+        """
+        return camel.models.ModelFactory.create(
+            model_platform=self.model_platform,
+            model_type=self.model_type,
+            model_config_dict=dict(self.model_config_dict)
+        )
+
+    def _get_function_tools(self, tools: List[Tool]) -> List['camel.toolkits.function_tool.FunctionTool']:
+        """Get the Camel FunctionTools for a set of tools, reusing the list built for the same tools.
+
+        Args:
+            tools (List[Tool]): The tools to wrap.
+
+        Returns:
+            List[FunctionTool]: The Camel wrappers of the tools.
+        """
+        key = tuple(tools)
+
+        if key in self._function_tool_lists:
+            self._function_tool_lists.move_to_end(key)
+            return self._function_tool_lists[key]
+
+        function_tools = [_get_function_tool(tool) for tool in tools]
+
+        # Bounded, since some callers (e.g. the querier) create new tools for every conversation
+        self._function_tool_lists[key] = function_tools
+        if len(self._function_tool_lists) > self.tool_cache_size:
+            self._function_tool_lists.popitem(last=False)
+
+        return function_tools
+
     def new_conversation(self, prompt: str, tools: List[ToolLike], category: Optional[str] = None) -> Conversation:
         """Start a new conversation with the given prompt and tools.
 
@@ -112,18 +176,22 @@ class CamelToolformer(Toolformer):
         Returns:
             Conversation: A Conversation instance managing the interaction.
         """
-        model = camel.models.ModelFactory.create(
-            model_platform=self.model_platform,
-            model_type=self.model_type,
-            model_config_dict=dict(self.model_config_dict)
-        )
-
         tools = [Tool.from_toollike(tool) for tool in tools]
 
+        if len(tools) == 0:
+            # Tool-less conversations can share the same backend
+            if self._model is None:
+                self._model = self._create_model()
+            model = self._model
+        else:
+            # ChatAgent stores the tool schemas in the backend's configuration, so it cannot be shared
+            model = self._create_model()
+
         agent = camel.agents.ChatAgent(
             model=model,
             system_message=camel.messages.BaseMessage.make_assistant_message('system', prompt),
-            tools=[camel.toolkits.function_tool.FunctionTool(tool.func, openai_tool_schema=tool.openai_schema) for tool in tools]
+            # Copied, so that the agent cannot alter the cached list
+            tools=list(self._get_function_tools(tools))
         )
 
         return CamelConversation(self, agent, category)
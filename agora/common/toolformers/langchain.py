@@ -1,6 +1,7 @@
-from typing import List, Optional
+import logging
+from typing import Iterator, List, Optional
 
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, SystemMessage
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph.graph import CompiledGraph
 from langgraph.prebuilt import create_react_agent
@@ -8,6 +9,8 @@ from langgraph.prebuilt import create_react_agent
 from agora.common.toolformers.base import Conversation, Tool, Toolformer, ToolLike
 from langchain_core.tools import tool as function_to_tool
 
+logger = logging.getLogger(__name__)
+
 
 class LangChainConversation(Conversation):
     def __init__(self, agent: CompiledGraph, messages: List[str], category: Optional[str] = None) -> None:
@@ -22,12 +25,12 @@ class LangChainConversation(Conversation):
         self.messages = messages
         self.category = category
 
-    def __call__(self, message: str, print_output: bool = True) -> str:
+    def __call__(self, message: str, print_output: bool = False) -> str:
         """Sends a message to the conversation and returns the AI response.
 
         Args:
             message (str): The user message or query.
-            print_output (bool, optional): Whether to print the AI response as it streams.
+            print_output (bool, optional): Whether to print the AI response as it streams. Defaults to False.
 
         Returns:
             str: The concatenated AI response.
@@ -55,18 +58,78 @@ class LangChainConversation(Conversation):
         if print_output:
             print()
 
+        logger.debug('LangChain reply: %s', final_message)
+
         self.messages.append(AIMessage(content=final_message))
 
         return final_message
+
+    def stream(self, message: str) -> Iterator[str]:
+        """Sends a message to the conversation and yields the AI response token by token.
+
+        Closing the generator early stops the agent. The (partial) response is recorded in the conversation history.
+
+        Args:
+            message (str): The user message or query.
+
+        Yields:
+            str: The chunks of the AI response.
+        """
+        self.messages.append(HumanMessage(content=message))
+        final_message = ''
+
+        chunks = self.agent.stream({'messages': self.messages}, stream_mode='messages')
+
+        try:
+            for chunk, _ in chunks:
+                if not isinstance(chunk, AIMessageChunk):
+                    continue
+
+                content = chunk.content
+                if isinstance(content, str):
+                    content_chunks = [content]
+                else:
+                    content_chunks = [content_chunk for content_chunk in content if isinstance(content_chunk, str)]
+
+                for content_chunk in content_chunks:
+                    if content_chunk:
+                        final_message += content_chunk
+                        yield content_chunk
+        finally:
+            chunks.close()
+            self.messages.append(AIMessage(content=final_message))
     
 class LangChainToolformer(Toolformer):
-    def __init__(self, model: BaseChatModel):
+    def __init__(self, model: BaseChatModel, name: Optional[str] = None):
         """Initializes a LangChainToolformer.
 
         Args:
             model (BaseChatModel): The underlying language model for processing.
+            name (Optional[str], optional): Optional name for the Toolformer. Defaults to None.
         """
         self.model = model
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        """Get the name of the Toolformer.
+
+        Returns:
+            str: The name of the Toolformer.
+
+        Raises:
+            ValueError: If no name was provided and the chat model does not expose a model identifier.
+        """
+        if self._name is not None:
+            return self._name
+
+        # Chat models expose the model under different attributes depending on the provider
+        model_name = getattr(self.model, 'model_name', None) or getattr(self.model, 'model', None)
+
+        if not isinstance(model_name, str) or not model_name:
+            raise ValueError(f'Cannot determine the model of {type(self.model).__name__}: pass an explicit name to LangChainToolformer.')
+
+        return f'{type(self.model).__name__}_{model_name}'
     
     def new_conversation(self, prompt: str, tools: List[ToolLike], category: Optional[str] = None) -> Conversation:
         """Creates a new conversation using the provided prompt and tools.
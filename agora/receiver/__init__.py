@@ -1,9 +1,31 @@
-from agora.receiver.core import Receiver
-from agora.receiver.memory import ReceiverMemory
-from agora.receiver.server import ReceiverServer
-
-import agora.receiver.server as server
-import agora.receiver.components.negotiator as negotiator
-import agora.receiver.components.programmer as programmer
-import agora.receiver.components.protocol_checker as protocol_checker
-import agora.receiver.components.responder as responder
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from agora.utils import lazy_module_getattr
+
+# Components are only imported when first accessed
+_LAZY_ATTRIBUTES = {
+    'Receiver': ('agora.receiver.core', 'Receiver'),
+    'ReceiverMemory': ('agora.receiver.memory', 'ReceiverMemory'),
+    'ReceiverServer': ('agora.receiver.server', 'ReceiverServer'),
+
+    'server': ('agora.receiver.server', None),
+    'negotiator': ('agora.receiver.components.negotiator', None),
+    'programmer': ('agora.receiver.components.programmer', None),
+    'protocol_checker': ('agora.receiver.components.protocol_checker', None),
+    'responder': ('agora.receiver.components.responder', None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_ATTRIBUTES)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from agora.receiver.core import Receiver
+    from agora.receiver.memory import ReceiverMemory
+    from agora.receiver.server import ReceiverServer
+
+    import agora.receiver.server as server
+    import agora.receiver.components.negotiator as negotiator
+    import agora.receiver.components.programmer as programmer
+    import agora.receiver.components.protocol_checker as protocol_checker
+    import agora.receiver.components.responder as responder
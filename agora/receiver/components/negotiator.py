@@ -50,18 +50,18 @@ class ReceiverNegotiator:
         Returns:
             Conversation: A Conversation instance managing the negotiation.
         """
-        prompt = TOOLS_NEGOTIATOR_PROMPT
+        parts = [TOOLS_NEGOTIATOR_PROMPT]
 
         if additional_info:
-            prompt += '\n\n' + additional_info
+            parts.extend(['\n\n', additional_info])
 
-        prompt += '\n\nThe tools that the implementer will have access to are:\n\n'
+        parts.append('\n\nThe tools that the implementer will have access to are:\n\n')
 
         if len(tools) == 0:
-            prompt += 'No additional tools provided'
+            parts.append('No additional tools provided')
         else:
-            for tool in tools:
-                tool = Tool.from_toollike(tool)
-                prompt += tool.as_documented_python() + '\n\n'
+            parts.extend(Tool.from_toollike(tool).as_documented_python() + '\n\n' for tool in tools)
+
+        prompt = ''.join(parts)
 
         return self.toolformer.new_conversation(prompt, tools, category='negotiation')
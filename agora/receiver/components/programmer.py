@@ -73,14 +73,14 @@ class ReceiverProgrammer:
         Returns:
             str: The generated implementation code.
         """
-        message = 'Protocol document:\n\n' + protocol_document + '\n\n' + 'Additional functions:\n\n'
+        parts = ['Protocol document:\n\n', protocol_document, '\n\n', 'Additional functions:\n\n']
 
         if len(tools) == 0:
-            message += 'No additional functions provided'
+            parts.append('No additional functions provided')
         else:
-            for tool in tools:
-                tool = Tool.from_toollike(tool)
-                message += str(tool) + '\n\n'
+            parts.extend(str(Tool.from_toollike(tool)) + '\n\n' for tool in tools)
+
+        message = ''.join(parts)
 
         prompt = TOOL_PROGRAMMER_PROMPT.format(
             reply_description=MULTIROUND_REPLY if multiround else NO_MULTIROUND_REPLY,
@@ -93,7 +93,8 @@ class ReceiverProgrammer:
         conversation = self.toolformer.new_conversation(prompt, [], category='programming')
 
         for _ in range(self.num_attempts):
-            reply = conversation(message, print_output=False)
+            # Stop generating as soon as the implementation is complete
+            reply = ''.join(conversation.stream_chat(message, stop_on=['</IMPLEMENTATION>']))
 
             implementation = extract_substring(reply, '<IMPLEMENTATION>', '</IMPLEMENTATION>', include_tags=False)
 
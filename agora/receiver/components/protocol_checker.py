@@ -1,23 +1,226 @@
-from typing import List
+import asyncio
+from collections import OrderedDict
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+from agora.common.core import Conversation
+from agora.common.storage import JSONStorage
 from agora.common.toolformers.base import Tool, ToolLike, Toolformer
+from agora.utils import compute_cache_key
+
+logger = logging.getLogger(__name__)
 
 CHECKER_TOOL_PROMPT = 'You are ProtocolCheckerGPT. Your task is to look at the provided protocol and determine if you have access ' \
     'to the tools required to implement it. A protocol is sufficiently expressive if an implementer could write code that, given a query formatted according to the protocol and the tools ' \
     'at your disposal, can parse the query according to the protocol\'s specification and send a reply. Think about it and at the end of the reply write "YES" if the' \
     'protocol is adequate or "NO". Do not attempt to implement the protocol or call the tools: that will be done by the implementer.'
 
+CHECKER_BATCH_PROMPT = 'You are ProtocolCheckerGPT. You will receive a numbered list of protocols, each with the tools that an implementer ' \
+    'would have access to. For each protocol, determine if the tools are sufficient to implement it. A protocol is sufficiently expressive if an implementer could write code that, ' \
+    'given a query formatted according to the protocol and the corresponding tools, can parse the query according to the protocol\'s specification and send a reply. ' \
+    'Think about it and at the end of the reply write a JSON object that maps the number of each protocol to "YES" if the protocol is adequate or "NO" otherwise, ' \
+    'for example {"1": "YES", "2": "NO"}. Do not attempt to implement the protocols or call the tools: that will be done by the implementer.'
+
 class ReceiverProtocolChecker:
     """Checks protocol validity and suitability for the Receiver."""
 
-    def __init__(self, toolformer : Toolformer):
+    def __init__(self, toolformer : Toolformer, batch_size: int = 8, cache_size: int = 256, cache_dir: Optional[str] = None):
         """Initialize the ReceiverProtocolChecker with a Toolformer.
 
         Args:
             toolformer (Toolformer): The Toolformer instance managing tools.
+            batch_size (int, optional): Maximum number of checks sent in a single request by check_many. Defaults to 8.
+            cache_size (int, optional): Maximum number of verdicts kept in memory. Defaults to 256.
+            cache_dir (Optional[str], optional): Directory where verdicts are persisted. If None, verdicts are only cached in memory. Defaults to None.
         """
         self.toolformer = toolformer
-    
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._verdicts : OrderedDict = OrderedDict()
+
+        if cache_dir is None:
+            self.cache = None
+        else:
+            self.cache = JSONStorage(Path(cache_dir) / 'receiver_protocol_checker.json')
+
+    def _cache_key(self, protocol_document: str, tools: List[Tool], additional_info: str, prompt: str = CHECKER_TOOL_PROMPT) -> str:
+        """Computes the key under which a verdict is cached.
+
+        Verdicts depend on the model and on the prompt that produced them, so both are part of the key.
+
+        Args:
+            protocol_document (str): The protocol document.
+            tools (List[Tool]): The tools available to the implementer.
+            additional_info (str): Additional information for evaluation.
+            prompt (str, optional): The prompt that produces the verdict. Defaults to CHECKER_TOOL_PROMPT.
+
+        Returns:
+            str: The cache key.
+        """
+        tool_signatures = '\n\n'.join(str(tool) for tool in sorted(tools, key=lambda tool: tool.name))
+        return compute_cache_key(self.toolformer.name, prompt, protocol_document, tool_signatures, additional_info)
+
+    def _get_cached(self, key: str) -> Optional[bool]:
+        """Retrieves a cached verdict.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bool]: The cached verdict, or None if not present.
+        """
+        if key in self._verdicts:
+            self._verdicts.move_to_end(key)
+            return self._verdicts[key]
+
+        if self.cache is not None and key in self.cache:
+            verdict = self.cache[key]
+            self._set_cached(key, verdict, persist=False)
+            return verdict
+
+        return None
+
+    def _set_cached(self, key: str, verdict: bool, persist: bool = True) -> None:
+        """Stores a verdict, evicting the least recently used one from memory if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            verdict (bool): The verdict to store.
+            persist (bool, optional): Whether to also store the verdict in the persistent cache (if any). Defaults to True.
+        """
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+
+        while len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
+
+        if persist and self.cache is not None:
+            self.cache[key] = verdict
+
+    def _describe_tools(self, tools: List[Tool]) -> str:
+        """Describes a list of tools for the checker.
+
+        Args:
+            tools (List[Tool]): The tools to describe.
+
+        Returns:
+            str: The description of the tools.
+        """
+        if len(tools) == 0:
+            return 'No additional functions provided'
+
+        return ''.join(str(tool) + '\n\n' for tool in tools)
+
+    def _create_conversation(self, protocol_document: str, tools: List[Tool], additional_info: str) -> Tuple[Conversation, str]:
+        """Creates the checking conversation and the message to send.
+
+        Args:
+            protocol_document (str): The protocol document to evaluate.
+            tools (List[Tool]): A list of tools available to implement the protocol.
+            additional_info (str): Additional information for evaluation.
+
+        Returns:
+            Tuple[Conversation, str]: The conversation and the message to send to it.
+        """
+        message = ''.join([
+            'Protocol document:\n\n', protocol_document, '\n\n',
+            'Functions that the implementer will have access to:\n\n',
+            self._describe_tools(tools)
+        ])
+
+        prompt = CHECKER_TOOL_PROMPT
+
+        if additional_info:
+            prompt += '\n\n' + additional_info
+
+        conversation = self.toolformer.new_conversation(prompt, [], category='protocolChecking')
+
+        return conversation, message
+
+    def _create_batch_conversation(self, items: List[Tuple[str, List[Tool]]], additional_info: str) -> Tuple[Conversation, str]:
+        """Creates a conversation that checks several protocols at once.
+
+        Args:
+            items (List[Tuple[str, List[Tool]]]): The (protocol document, tools) pairs to evaluate.
+            additional_info (str): Additional information for evaluation.
+
+        Returns:
+            Tuple[Conversation, str]: The conversation and the message to send to it.
+        """
+        parts = []
+
+        for i, (protocol_document, tools) in enumerate(items):
+            parts.extend([
+                f'=== Protocol {i + 1} ===\n\n',
+                'Protocol document:\n\n', protocol_document, '\n\n',
+                'Functions that the implementer will have access to:\n\n',
+                self._describe_tools(tools), '\n\n'
+            ])
+
+        message = ''.join(parts)
+
+        prompt = CHECKER_BATCH_PROMPT
+
+        if additional_info:
+            prompt += '\n\n' + additional_info
+
+        conversation = self.toolformer.new_conversation(prompt, [], category='protocolChecking')
+
+        return conversation, message
+
+    @staticmethod
+    def _parse_reply(reply: str) -> bool:
+        """Parses the verdict of a single check.
+
+        Only the tail of the reply is lowercased, since the verdict is at the end.
+
+        Args:
+            reply (str): The reply of the checker.
+
+        Returns:
+            bool: True if the checker deemed the protocol adequate, False otherwise.
+        """
+        tail = reply.rstrip()[-10:].lower()
+        logger.debug('Protocol checker reply: %s', reply)
+        return 'yes' in tail
+
+    @staticmethod
+    def _parse_batch_reply(reply: str, num_items: int) -> Dict[int, bool]:
+        """Parses the verdicts of a batched check.
+
+        Args:
+            reply (str): The reply of the checker.
+            num_items (int): The number of checked protocols.
+
+        Returns:
+            Dict[int, bool]: A mapping from the (0-based) index of each protocol to its verdict.
+                Protocols without a valid verdict are omitted.
+        """
+        start = reply.rfind('{')
+        end = reply.rfind('}')
+
+        if start == -1 or end < start:
+            return {}
+
+        try:
+            raw_verdicts = json.loads(reply[start:end + 1])
+        except json.JSONDecodeError:
+            return {}
+
+        if not isinstance(raw_verdicts, dict):
+            return {}
+
+        verdicts = {}
+        for i in range(num_items):
+            verdict = raw_verdicts.get(str(i + 1))
+
+            if isinstance(verdict, str) and verdict.strip().lower() in ('yes', 'no'):
+                verdicts[i] = verdict.strip().lower() == 'yes'
+
+        return verdicts
+
     def __call__(self, protocol_document : str, tools : List[ToolLike], additional_info : str = '') -> bool:
         """Determine if the protocol is suitable based on available tools.
 
@@ -29,26 +232,153 @@ class ReceiverProtocolChecker:
         Returns:
             bool: True if the protocol is suitable, False otherwise.
         """
-        message = 'Protocol document:\n\n' + protocol_document + '\n\n' + 'Functions that the implementer will have access to:\n\n'
+        tools = [Tool.from_toollike(tool) for tool in tools]
+        key = self._cache_key(protocol_document, tools, additional_info)
 
-        if len(tools) == 0:
-            message += 'No additional functions provided'
-        else:
-            for tool in tools:
-                tool = Tool.from_toollike(tool)
-                message += str(tool) + '\n\n'
+        verdict = self._get_cached(key)
 
-        prompt = CHECKER_TOOL_PROMPT
+        if verdict is None:
+            conversation, message = self._create_conversation(protocol_document, tools, additional_info)
 
-        if additional_info:
-            prompt += '\n\n' + additional_info
+            reply = conversation(message, print_output=False)
 
-        conversation = self.toolformer.new_conversation(prompt, [], category='protocolChecking')
+            verdict = self._parse_reply(reply)
+            self._set_cached(key, verdict)
+
+        return verdict
+
+    async def acall(self, protocol_document : str, tools : List[ToolLike], additional_info : str = '') -> bool:
+        """Asynchronously determine if the protocol is suitable based on available tools.
+
+        Args:
+            protocol_document (str): The protocol document to evaluate.
+            tools (List[ToolLike]): A list of tools available to implement the protocol.
+            additional_info (str, optional): Additional information for evaluation. Defaults to ''.
+
+        Returns:
+            bool: True if the protocol is suitable, False otherwise.
+        """
+        tools = [Tool.from_toollike(tool) for tool in tools]
+        key = self._cache_key(protocol_document, tools, additional_info)
+
+        verdict = self._get_cached(key)
+
+        if verdict is None:
+            conversation, message = self._create_conversation(protocol_document, tools, additional_info)
+
+            reply = await conversation.acall(message, print_output=False)
+
+            verdict = self._parse_reply(reply)
+            self._set_cached(key, verdict)
+
+        return verdict
+
+    def _pending_batches(self, items: List[Tuple[str, List[ToolLike]]], additional_info: str) -> Tuple[List[Optional[bool]], List[List[Tuple[List[int], str, str, List[Tool]]]]]:
+        """Resolves cached verdicts and splits the remaining checks into batches.
+
+        Identical checks are only included once. Verdicts of single checks are also used, since they are
+        at least as reliable as batched ones.
+
+        Args:
+            items (List[Tuple[str, List[ToolLike]]]): The (protocol document, tools) pairs to evaluate.
+            additional_info (str): Additional information for evaluation.
+
+        Returns:
+            Tuple[List[Optional[bool]], List[List[Tuple[List[int], str, str, List[Tool]]]]]: The verdicts (None for pending checks)
+                and the batches of pending checks, as (indices in items, batch cache key, protocol document, tools) tuples.
+        """
+        verdicts = []
+        pending = OrderedDict()
+
+        for i, (protocol_document, tools) in enumerate(items):
+            tools = [Tool.from_toollike(tool) for tool in tools]
+            key = self._cache_key(protocol_document, tools, additional_info, prompt=CHECKER_BATCH_PROMPT)
+            verdict = self._get_cached(key)
+
+            if verdict is None:
+                verdict = self._get_cached(self._cache_key(protocol_document, tools, additional_info))
+
+            verdicts.append(verdict)
+
+            if verdict is None:
+                if key not in pending:
+                    pending[key] = ([], key, protocol_document, tools)
+                pending[key][0].append(i)
+
+        pending = list(pending.values())
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+
+        return verdicts, batches
+
+    def _store_batch_verdicts(self, batch: List[Tuple[List[int], str, str, List[Tool]]], batch_verdicts: Dict[int, bool], verdicts: List[Optional[bool]]) -> None:
+        """Stores the verdicts of a batch, both in the results and in the cache.
+
+        Args:
+            batch (List[Tuple[List[int], str, str, List[Tool]]]): The checked batch.
+            batch_verdicts (Dict[int, bool]): The parsed verdicts, indexed by position in the batch.
+            verdicts (List[Optional[bool]]): The overall results, updated in place.
+        """
+        for j, verdict in batch_verdicts.items():
+            indices, key, _, _ = batch[j]
+
+            for i in indices:
+                verdicts[i] = verdict
+
+            self._set_cached(key, verdict)
+
+    def check_many(self, items: List[Tuple[str, List[ToolLike]]], additional_info: str = '') -> List[bool]:
+        """Determine the suitability of several protocols, batching them into as few requests as possible.
+
+        Protocols for which the batched reply does not contain a valid verdict are checked individually.
+
+        Args:
+            items (List[Tuple[str, List[ToolLike]]]): The (protocol document, tools) pairs to evaluate.
+            additional_info (str, optional): Additional information for evaluation. Defaults to ''.
+
+        Returns:
+            List[bool]: The verdict for each pair, in the same order as items.
+        """
+        verdicts, batches = self._pending_batches(items, additional_info)
+
+        for batch in batches:
+            conversation, message = self._create_batch_conversation([(protocol_document, tools) for _, _, protocol_document, tools in batch], additional_info)
+            reply = conversation(message, print_output=False)
+            self._store_batch_verdicts(batch, self._parse_batch_reply(reply, len(batch)), verdicts)
+
+        for batch in batches:
+            for indices, _, protocol_document, tools in batch:
+                if verdicts[indices[0]] is None:
+                    verdict = self(protocol_document, tools, additional_info)
+
+                    for i in indices:
+                        verdicts[i] = verdict
+
+        return verdicts
+
+    async def acheck_many(self, items: List[Tuple[str, List[ToolLike]]], additional_info: str = '') -> List[bool]:
+        """Asynchronously determine the suitability of several protocols, sending the batches concurrently.
+
+        Args:
+            items (List[Tuple[str, List[ToolLike]]]): The (protocol document, tools) pairs to evaluate.
+            additional_info (str, optional): Additional information for evaluation. Defaults to ''.
+
+        Returns:
+            List[bool]: The verdict for each pair, in the same order as items.
+        """
+        verdicts, batches = self._pending_batches(items, additional_info)
+
+        async def check_batch(batch):
+            conversation, message = self._create_batch_conversation([(protocol_document, tools) for _, _, protocol_document, tools in batch], additional_info)
+            reply = await conversation.acall(message, print_output=False)
+            self._store_batch_verdicts(batch, self._parse_batch_reply(reply, len(batch)), verdicts)
+
+        await asyncio.gather(*[check_batch(batch) for batch in batches])
 
-        reply = conversation(message, print_output=False)
+        missing = [entry for batch in batches for entry in batch if verdicts[entry[0][0]] is None]
+        fallback_verdicts = await asyncio.gather(*[self.acall(protocol_document, tools, additional_info) for _, _, protocol_document, tools in missing])
 
-        # print('Reply:', reply)
-        # print(reply.lower().strip()[-10:])
-        # print('Parsed decision:', 'yes' in reply.lower().strip()[-10:])
+        for (indices, _, _, _), verdict in zip(missing, fallback_verdicts):
+            for i in indices:
+                verdicts[i] = verdict
 
-        return 'yes' in reply.lower().strip()[-10:]
\ No newline at end of file
+        return verdicts
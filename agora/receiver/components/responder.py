@@ -1,10 +1,13 @@
 # The responder is a special toolformer that replies to a service based on a protocol document.
 # It receives the protocol document and writes the response that must be sent to the system.
 
+import logging
 from typing import List, Optional
 
 from agora.common.toolformers.base import Conversation, ToolLike, Toolformer
 
+logger = logging.getLogger(__name__)
+
 
 PROTOCOL_RESPONDER_PROMPT = 'You are ResponderGPT. Below you will find a document describing detailing how to respond to a query. '\
     'The communication might involve multiple rounds of back-and-forth.' \
@@ -35,7 +38,7 @@ class Responder:
         Returns:
             Conversation: The newly created conversation following the protocol.
         """
-        # print('===NL RESPONDER (WITH PROTOCOL)===')
+        logger.debug('Creating responder conversation (with protocol)')
 
         prompt = PROTOCOL_RESPONDER_PROMPT
 
@@ -57,8 +60,7 @@ class Responder:
         Returns:
             Conversation: The created NL conversation.
         """
-        # print('===NL RESPONDER (NO PROTOCOL)===')
-        # print('Preparing NL response with tools:', [tool.name for tool in tools])
+        logger.debug('Creating responder conversation (no protocol)')
 
         prompt = NL_RESPONDER_PROMPT
 
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from agora.common.core import Suitability
 
-from agora.common.toolformers.base import Conversation, ToolLike
+from agora.common.toolformers.base import Conversation, Tool, ToolLike, Toolformer
 from agora.common.errors import ProtocolRejectedError, ProtocolRetrievalError
 from agora.common.storage import Storage, JSONStorage
 from agora.common.executor import Executor, RestrictedExecutor
@@ -51,7 +51,8 @@ class Receiver:
         self.negotiator = negotiator
         self.programmer = programmer
         self.executor = executor
-        self.tools = tools
+        # Converted once, so that the memoized schemas and toolformer wrappers of each Tool are reused across conversations
+        self.tools = [Tool.from_toollike(tool) for tool in tools]
         self.additional_info = additional_info
         self.implementation_threshold = implementation_threshold
 
@@ -67,7 +68,8 @@ class Receiver:
         tools: List[ToolLike] = None,
         additional_info: str = '',
         storage_path: str = './.agora/storage/receiver.json',
-        implementation_threshold: int = 5
+        implementation_threshold: int = 5,
+        cheap_toolformer: Optional[Toolformer] = None
     ) -> 'Receiver':
         """
         Creates a default Receiver instance with customizable components.
@@ -84,6 +86,7 @@ class Receiver:
             additional_info (str, optional): Extra info. Defaults to ''.
             storage_path (str, optional): Path for JSON storage. Defaults to './receiver_storage.json'.
             implementation_threshold (int, optional): Threshold for code generation.
+            cheap_toolformer (Toolformer, optional): A cheaper/faster toolformer (e.g. a "mini" model) used for the YES/NO protocol checks. Defaults to None (use toolformer).
 
         Returns:
             Receiver: A configured Receiver instance.
@@ -98,8 +101,11 @@ class Receiver:
         if responder is None:
             responder = Responder(toolformer)
 
+        if cheap_toolformer is None:
+            cheap_toolformer = toolformer
+
         if protocol_checker is None:
-            protocol_checker = ReceiverProtocolChecker(toolformer)
+            protocol_checker = ReceiverProtocolChecker(cheap_toolformer)
 
         if negotiator is None:
             negotiator = ReceiverNegotiator(toolformer)
@@ -1,9 +1,12 @@
+import logging
 import uuid
 from flask import Flask, request, jsonify
 
 from agora.receiver.core import Receiver
 from threading import Timer
 
+logger = logging.getLogger(__name__)
+
 
 class ReceiverServer:
     """Handles and manages HTTP conversations via Flask with a given Receiver.
@@ -51,8 +54,7 @@ class ReceiverServer:
 
                 return jsonify(response)
             except Exception as e:
-                import traceback
-                traceback.print_exc()
+                logger.exception('Error while handling a conversation')
                 return jsonify({
                     'status': 'error',
                     'message': str(e)
@@ -1,10 +1,33 @@
-from agora.sender.core import Sender
-from agora.sender.memory import SenderMemory
-from agora.sender.schema_generator import TaskSchemaGenerator
-
-import agora.sender.schema_generator as schema_generator
-import agora.sender.components.negotiator as negotiator
-import agora.sender.components.programmer as programmer
-import agora.sender.components.protocol_picker as protocol_picker
-import agora.sender.components.querier as querier
-import agora.sender.components.transporter as transporter
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from agora.utils import lazy_module_getattr
+
+# Components are only imported when first accessed
+_LAZY_ATTRIBUTES = {
+    'Sender': ('agora.sender.core', 'Sender'),
+    'SenderMemory': ('agora.sender.memory', 'SenderMemory'),
+    'TaskSchemaGenerator': ('agora.sender.schema_generator', 'TaskSchemaGenerator'),
+
+    'schema_generator': ('agora.sender.schema_generator', None),
+    'negotiator': ('agora.sender.components.negotiator', None),
+    'programmer': ('agora.sender.components.programmer', None),
+    'protocol_picker': ('agora.sender.components.protocol_picker', None),
+    'querier': ('agora.sender.components.querier', None),
+    'transporter': ('agora.sender.components.transporter', None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_ATTRIBUTES)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from agora.sender.core import Sender
+    from agora.sender.memory import SenderMemory
+    from agora.sender.schema_generator import TaskSchemaGenerator
+
+    import agora.sender.schema_generator as schema_generator
+    import agora.sender.components.negotiator as negotiator
+    import agora.sender.components.programmer as programmer
+    import agora.sender.components.protocol_picker as protocol_picker
+    import agora.sender.components.querier as querier
+    import agora.sender.components.transporter as transporter
@@ -1,10 +1,16 @@
-from typing import Callable
+from collections import deque
+import hashlib
+import inspect
+import logging
+from typing import Awaitable, Callable, Optional, Tuple
 
-from agora.common.core import Protocol
+from agora.common.core import Conversation, Protocol
 from agora.sender.task_schema import TaskSchema, TaskSchemaLike
 from agora.common.toolformers.base import Toolformer
 from agora.utils import extract_metadata, extract_substring
 
+logger = logging.getLogger(__name__)
+
 NEGOTIATION_RULES = '''
 Here are some rules (that should also be explained to the other GPT):
 - You can assume that the protocol has a sender and a receiver. Do not worry about how the messages will be delivered, focus only on the content of the messages.
@@ -39,67 +45,218 @@ Body of the protocol...
 </FINALPROTOCOL>
 '''
 
+# The task-specific information is sent as the first message rather than appended to the system prompt,
+# so that the (long) system prompt is identical across negotiations and can be served from the provider's prompt cache
+TASK_SCHEMA_HEADER = 'The JSON schema of the task is the following:\n\n'
+
+OTHER_PARTY_OPENING = 'The other party has joined the negotiation and says:\n\nHello! How may I help you?'
+
+FINALIZATION_REQUEST = 'You are repeating yourself, so the negotiation is over. Reply now with the final version of the protocol, ' \
+    'wrapped between the tags <FINALPROTOCOL> and </FINALPROTOCOL>.'
+
+class _NegotiationTracker:
+    """Tracks the messages of a negotiation to detect repetition and budget exhaustion."""
+
+    def __init__(self, max_generated_chars: Optional[int]) -> None:
+        """Initializes the tracker.
+
+        Args:
+            max_generated_chars (Optional[int]): Maximum number of characters the negotiator can generate. If None, there is no limit.
+        """
+        self.max_generated_chars = max_generated_chars
+        self.generated_chars = 0
+        self.finalization_requested = False
+        self.recent_hashes = deque(maxlen=2)
+
+    def register(self, message: str) -> None:
+        """Registers a message (without a final protocol) of the negotiator.
+
+        Args:
+            message (str): The message.
+        """
+        self.generated_chars += len(message)
+
+        # Normalize whitespace and case, so that trivially restated messages are also caught
+        normalized = ' '.join(message.lower().split())
+        message_hash = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
+        if message_hash in self.recent_hashes:
+            self.finalization_requested = True
+
+        self.recent_hashes.append(message_hash)
+
+    @property
+    def budget_exceeded(self) -> bool:
+        """Whether the negotiator has generated more characters than allowed."""
+        return self.max_generated_chars is not None and self.generated_chars > self.max_generated_chars
+
 class SenderNegotiator:
     """Manages the negotiation of protocols for sending tasks."""
 
-    def __init__(self, toolformer: Toolformer, max_rounds: int = 10) -> None:
+    def __init__(self, toolformer: Toolformer, max_rounds: int = 10, max_generated_chars: Optional[int] = None) -> None:
         """Initializes the SenderNegotiator.
 
+        If the negotiator repeats one of its last two messages, it is asked to finalize the protocol immediately;
+        if it does not comply, the negotiation is aborted.
+
         Args:
             toolformer (Toolformer): The Toolformer instance.
             max_rounds (int): Maximum number of negotiation rounds.
+            max_generated_chars (Optional[int]): Maximum number of characters that the negotiator can generate
+                before the negotiation is aborted. If None, there is no limit.
         """
         self.toolformer = toolformer
         self.max_rounds = max_rounds
+        self.max_generated_chars = max_generated_chars
 
-    def __call__(self, task_schema: TaskSchemaLike, callback: Callable[[str], str], additional_info: str = '') -> Protocol:
-        """Negotiates and finalizes a protocol based on the task schema.
+    def _create_conversation(self, task_schema: TaskSchemaLike, additional_info: str) -> Tuple[Conversation, str]:
+        """Creates the negotiation conversation for a task.
 
         Args:
             task_schema (TaskSchemaLike): The schema of the task.
-            callback (Callable[[str], str]): A callback to handle messages from the other party.
             additional_info (str): Additional information for the negotiation.
 
         Returns:
-            Protocol: The finalized Protocol object.
+            Tuple[Conversation, str]: The negotiation conversation and the first message to send to it.
         """
         task_schema = TaskSchema.from_taskschemalike(task_schema)
-        found_protocol = None
-
-        prompt = TASK_NEGOTIATOR_PROMPT + '\nThe JSON schema of the task is the following:\n\n' + str(task_schema)
 
         if additional_info:
-            prompt += '\n\n' + additional_info
+            first_message = f'{TASK_SCHEMA_HEADER}{task_schema.serialized_json}\n\n{additional_info}\n\n{OTHER_PARTY_OPENING}'
+        else:
+            first_message = f'{TASK_SCHEMA_HEADER}{task_schema.serialized_json}\n\n{OTHER_PARTY_OPENING}'
+
+        conversation = self.toolformer.new_conversation(TASK_NEGOTIATOR_PROMPT, [], category='negotiation')
+
+        return conversation, first_message
+
+    def _extract_protocol(self, message: str) -> Optional[Protocol]:
+        """Extracts the final protocol from a message, if present.
+
+        Args:
+            message (str): The message of the negotiator.
+
+        Returns:
+            Optional[Protocol]: The finalized Protocol, or None if the negotiation is still ongoing.
+        """
+        protocol = extract_substring(message, '<FINALPROTOCOL>', '</FINALPROTOCOL>', include_tags=False)
+
+        if protocol is None:
+            return None
+
+        metadata = extract_metadata(protocol)
+        return Protocol(protocol, [], metadata)
+
+    def _parse_response(self, response: dict) -> str:
+        """Converts the response of the other party into the next message for the negotiator.
+
+        Args:
+            response (dict): The response returned by the callback.
+
+        Returns:
+            str: The message to send to the negotiator.
+        """
+        if response['status'] == 'success':
+            return response['body']
+        return 'Error interacting with the other party: ' + response['message']
+
+    def _process_message(self, tracker: _NegotiationTracker, message: str) -> Tuple[bool, Optional[Protocol], Optional[str]]:
+        """Decides how the negotiation continues after a message of the negotiator.
+
+        Args:
+            tracker (_NegotiationTracker): The tracker of the negotiation.
+            message (str): The message of the negotiator.
 
-        conversation = self.toolformer.new_conversation(prompt, [], category='negotiation')
+        Returns:
+            Tuple[bool, Optional[Protocol], Optional[str]]: Whether the negotiation is over, the final protocol
+                (None if the negotiation was aborted or is not over) and the message to send back to the negotiator
+                instead of forwarding the message to the other party (None if it should be forwarded).
+        """
+        protocol = self._extract_protocol(message)
+
+        if protocol is not None:
+            return True, protocol, None
+
+        if tracker.finalization_requested:
+            logger.info('Negotiator did not finalize the protocol when asked to, aborting negotiation')
+            return True, None, None
+
+        tracker.register(message)
+
+        if tracker.budget_exceeded:
+            logger.info('Negotiation budget exceeded, aborting negotiation')
+            return True, None, None
+
+        if tracker.finalization_requested:
+            # Do not forward the repeated message, ask for the final protocol instead
+            return False, None, FINALIZATION_REQUEST
+
+        return False, None, None
+
+    def __call__(self, task_schema: TaskSchemaLike, callback: Callable[[str], dict], additional_info: str = '') -> Optional[Protocol]:
+        """Negotiates and finalizes a protocol based on the task schema.
 
-        other_message = 'Hello! How may I help you?'
+        Args:
+            task_schema (TaskSchemaLike): The schema of the task.
+            callback (Callable[[str], dict]): A callback to handle messages from the other party.
+            additional_info (str): Additional information for the negotiation.
+
+        Returns:
+            Optional[Protocol]: The finalized Protocol object, or None if no protocol was agreed upon.
+        """
+        conversation, other_message = self._create_conversation(task_schema, additional_info)
+        tracker = _NegotiationTracker(self.max_generated_chars)
 
         for i in range(self.max_rounds):
-            # print('===NegotiatorGPT===')
-            message = conversation(other_message, print_output=False)
-
-            # print('Checking if we can extract from:', message)
-            # print('---------')
-            protocol = extract_substring(message, '<FINALPROTOCOL>', '</FINALPROTOCOL>', include_tags=False)
-
-            if protocol is None:
-                # print('Could not extract')
-                response = callback(message)
-
-                if response['status'] == 'success':
-                    other_message = response['body']
-                else:
-                    other_message = 'Error interacting with the other party: ' + response['message']
-
-                # print()
-                # print('===Other GPT===')
-                # print(other_message)
-                # print()
-            else:
-                metadata = extract_metadata(protocol)
-                
-                found_protocol = Protocol(protocol, [], metadata)
-                break
-
-        return found_protocol
\ No newline at end of file
+            # Stop generating as soon as the final protocol is complete
+            message = ''.join(conversation.stream_chat(other_message, stop_on=['</FINALPROTOCOL>']))
+
+            logger.debug('Negotiator message (round %d): %s', i, message)
+            finished, protocol, other_message = self._process_message(tracker, message)
+
+            if finished:
+                return protocol
+
+            if other_message is not None:
+                continue
+
+            other_message = self._parse_response(callback(message))
+
+        return None
+
+    async def acall(self, task_schema: TaskSchemaLike, callback: Callable[[str], dict | Awaitable[dict]], additional_info: str = '') -> Optional[Protocol]:
+        """Asynchronously negotiates and finalizes a protocol based on the task schema.
+
+        Multiple negotiations (e.g. with different targets) can be awaited concurrently.
+
+        Args:
+            task_schema (TaskSchemaLike): The schema of the task.
+            callback (Callable[[str], dict | Awaitable[dict]]): A (possibly asynchronous) callback to handle messages from the other party.
+            additional_info (str): Additional information for the negotiation.
+
+        Returns:
+            Optional[Protocol]: The finalized Protocol object, or None if no protocol was agreed upon.
+        """
+        conversation, other_message = self._create_conversation(task_schema, additional_info)
+        tracker = _NegotiationTracker(self.max_generated_chars)
+
+        for i in range(self.max_rounds):
+            message = await conversation.astream_chat(other_message, stop_on=['</FINALPROTOCOL>'])
+
+            logger.debug('Negotiator message (round %d): %s', i, message)
+            finished, protocol, other_message = self._process_message(tracker, message)
+
+            if finished:
+                return protocol
+
+            if other_message is not None:
+                continue
+
+            response = callback(message)
+
+            if inspect.isawaitable(response):
+                response = await response
+
+            other_message = self._parse_response(response)
+
+        return None
@@ -1,6 +1,16 @@
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from agora.common.core import Conversation
+from agora.common.storage import JSONStorage
 from agora.sender.task_schema import TaskSchema, TaskSchemaLike
 from agora.common.toolformers.base import Toolformer
-from agora.utils import extract_substring
+from agora.utils import compute_cache_key, extract_substring
+
+logger = logging.getLogger(__name__)
 
 TASK_PROGRAMMER_PROMPT = '''
 You are ProtocolProgrammerGPT. You will act as an intermediate between a machine (that has a certain input and output schema in JSON) \
@@ -34,18 +44,74 @@ def send_query(task_data):
 </IMPLEMENTATION>
 '''
 
+IMPLEMENTATION_REMINDER = 'You have not provided an implementation yet. Please provide one by surrounding it in the tags <IMPLEMENTATION> and </IMPLEMENTATION>.'
+
 class SenderProgrammer:
     """Generates implementations based on task schemas and protocol documents."""
 
-    def __init__(self, toolformer: Toolformer, num_attempts: int = 5):
+    def __init__(self, toolformer: Toolformer, num_attempts: int = 5, cache_dir: Optional[str] = None, num_parallel_attempts: int = 1):
         """Initializes the SenderProgrammer.
 
         Args:
             toolformer (Toolformer): The Toolformer instance.
             num_attempts (int): Number of attempts to generate implementations.
+            cache_dir (Optional[str]): Directory where generated implementations are cached. If None, caching is disabled.
+            num_parallel_attempts (int): Number of independent first attempts that acall sends concurrently. The first valid one is used.
         """
         self.toolformer = toolformer
         self.num_attempts = num_attempts
+        self.num_parallel_attempts = num_parallel_attempts
+
+        if cache_dir is None:
+            self.cache = None
+        else:
+            self.cache = JSONStorage(Path(cache_dir) / 'sender_programmer.json')
+
+    def _cache_key(self, task_schema: TaskSchemaLike, protocol_document: str) -> str:
+        """Computes the key under which an implementation is cached.
+
+        Implementations depend on the model, so its name is part of the key.
+
+        Args:
+            task_schema (TaskSchemaLike): The schema of the task.
+            protocol_document (str): The protocol specifications.
+
+        Returns:
+            str: The cache key.
+        """
+        task_schema = TaskSchema.from_taskschemalike(task_schema)
+        return compute_cache_key(self.toolformer.name, TASK_PROGRAMMER_PROMPT, json.dumps(task_schema.to_json(), sort_keys=True), protocol_document)
+
+    def _initial_message(self, task_schema: TaskSchemaLike, protocol_document: str) -> str:
+        """Builds the first message sent to the programmer.
+
+        Args:
+            task_schema (TaskSchemaLike): The schema of the task.
+            protocol_document (str): The protocol specifications.
+
+        Returns:
+            str: The message.
+        """
+        task_schema = TaskSchema.from_taskschemalike(task_schema)
+        return f'JSON schema:\n\n{task_schema.serialized_json}\n\nProtocol document:\n\n{protocol_document}'
+
+    def _postprocess(self, implementation: str) -> str:
+        """Cleans up an extracted implementation.
+
+        Args:
+            implementation (str): The raw implementation extracted from the reply.
+
+        Returns:
+            str: The cleaned implementation code.
+        """
+        implementation = implementation.strip()
+
+        # Sometimes the LLM leaves the Markdown formatting in the implementation
+        implementation = implementation.replace('```python', '').replace('```', '').strip()
+
+        implementation = implementation.replace('def send_query(', 'def run(')
+
+        return implementation
 
     def __call__(self, task_schema: TaskSchemaLike, protocol_document: str) -> str:
         """Generates implementation code for a given schema and protocol.
@@ -57,25 +123,124 @@ class SenderProgrammer:
         Returns:
             str: The generated implementation code.
         """
-        task_schema = TaskSchema.from_taskschemalike(task_schema)
+        if self.cache is not None:
+            key = self._cache_key(task_schema, protocol_document)
+
+            if key in self.cache:
+                return self.cache[key]
+
         conversation = self.toolformer.new_conversation(TASK_PROGRAMMER_PROMPT, [], category='programming')
-        message = 'JSON schema:\n\n' + str(task_schema) + '\n\n' + 'Protocol document:\n\n' + protocol_document
+        message = self._initial_message(task_schema, protocol_document)
 
         for _ in range(self.num_attempts):
-            reply = conversation(message, print_output=False)
+            # Stop generating as soon as the implementation is complete
+            reply = ''.join(conversation.stream_chat(message, stop_on=['</IMPLEMENTATION>']))
 
             implementation = extract_substring(reply, '<IMPLEMENTATION>', '</IMPLEMENTATION>', include_tags=False)
 
             if implementation is not None:
                 break
 
-            message = 'You have not provided an implementation yet. Please provide one by surrounding it in the tags <IMPLEMENTATION> and </IMPLEMENTATION>.'
+            message = IMPLEMENTATION_REMINDER
 
-        implementation = implementation.strip()
+        implementation = self._postprocess(implementation)
 
-        # Sometimes the LLM leaves the Markdown formatting in the implementation
-        implementation = implementation.replace('```python', '').replace('```', '').strip()
+        if self.cache is not None:
+            self.cache[key] = implementation
 
-        implementation = implementation.replace('def send_query(', 'def run(')
+        return implementation
+
+    async def _first_implementation(self, conversations: List[Conversation], message: str) -> Tuple[Optional[str], Conversation]:
+        """Sends the same message to several conversations and returns the first valid implementation.
+
+        The remaining requests are cancelled as soon as a valid implementation is found: their streams are closed,
+        but non-streaming conversations still complete their current request in the background. Drafts that fail
+        are treated as drafts without an implementation.
+
+        Args:
+            conversations (List[Conversation]): The independent programming conversations.
+            message (str): The message to send.
+
+        Returns:
+            Tuple[Optional[str], Conversation]: The first extracted implementation (None if no reply contained one)
+                and the conversation that produced it (or, if there is none, the last conversation that replied).
+
+        Raises:
+            Exception: The error of the last failed draft, if no draft replied.
+        """
+        tasks = {
+            asyncio.create_task(conversation.astream_chat(message, stop_on=['</IMPLEMENTATION>'])): conversation
+            for conversation in conversations
+        }
+        pending = set(tasks)
+        replied_conversation = None
+        last_error = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    try:
+                        reply = task.result()
+                    except Exception as e:
+                        logger.warning('Programming draft failed', exc_info=True)
+                        last_error = e
+                        continue
+
+                    # Only conversations that replied can be reprompted
+                    replied_conversation = tasks[task]
+                    implementation = extract_substring(reply, '<IMPLEMENTATION>', '</IMPLEMENTATION>', include_tags=False)
+
+                    if implementation is not None:
+                        return implementation, replied_conversation
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if replied_conversation is None:
+            raise last_error
+
+        return None, replied_conversation
+
+    async def acall(self, task_schema: TaskSchemaLike, protocol_document: str) -> str:
+        """Asynchronously generates implementation code for a given schema and protocol.
+
+        The first attempt is sent to num_parallel_attempts independent conversations at once. If none of them
+        provides an implementation, the remaining attempts are made sequentially.
+
+        Args:
+            task_schema (TaskSchemaLike): The schema of the task.
+            protocol_document (str): The protocol specifications.
+
+        Returns:
+            str: The generated implementation code.
+        """
+        if self.cache is not None:
+            key = self._cache_key(task_schema, protocol_document)
+
+            if key in self.cache:
+                return self.cache[key]
+
+        conversations = [
+            self.toolformer.new_conversation(TASK_PROGRAMMER_PROMPT, [], category='programming')
+            for _ in range(max(self.num_parallel_attempts, 1))
+        ]
+        message = self._initial_message(task_schema, protocol_document)
+
+        implementation, conversation = await self._first_implementation(conversations, message)
+
+        for _ in range(self.num_attempts - 1):
+            if implementation is not None:
+                break
+
+            reply = await conversation.astream_chat(IMPLEMENTATION_REMINDER, stop_on=['</IMPLEMENTATION>'])
+
+            implementation = extract_substring(reply, '<IMPLEMENTATION>', '</IMPLEMENTATION>', include_tags=False)
+
+        implementation = self._postprocess(implementation)
+
+        if self.cache is not None:
+            self.cache[key] = implementation
 
         return implementation
@@ -33,11 +33,11 @@ class ProtocolPicker:
         task_schema = TaskSchema.from_taskschemalike(task_schema)
         conversation = self.toolformer.new_conversation(CHECKER_TASK_PROMPT, [], category='protocolChecking')
 
-        message = 'The protocol is the following:\n\n' + protocol_document + '\n\nThe task is the following:\n\n' + str(task_schema)
+        message = f'The protocol is the following:\n\n{protocol_document}\n\nThe task is the following:\n\n{task_schema.serialized_json}'
 
         reply = conversation(message, print_output=False)
 
-        return 'yes' in reply.lower().strip()[-10:]
+        return 'yes' in reply.rstrip()[-10:].lower()
 
     def pick_protocol(
         self,
@@ -2,12 +2,15 @@
 # It receives the protocol document and writes the query that must be performed to the system.
 
 import json
+import logging
 from typing import Any, Callable, Dict
 
 from agora.sender.task_schema import TaskSchema, TaskSchemaLike
 from agora.common.errors import ExecutionError, ProtocolRejectedError
 from agora.common.toolformers.base import Toolformer, Tool
 
+logger = logging.getLogger(__name__)
+
 PROTOCOL_QUERIER_PROMPT = 'You are NaturalLanguageQuerierGPT. You act as an intermediary between a machine (who has a very specific input and output schema) and an external service (which follows a very specific protocol).' \
     'You will receive a task description (including a schema of the input and output that the machine uses) and the corresponding data. Call the \"send_query\" tool with a message following the protocol.' \
     'Do not worry about managing communication, everything is already set up for you. Just focus on sending the right message.' \
@@ -29,21 +32,22 @@ def construct_query_description(protocol_document: str, task_schema: TaskSchemaL
     Returns:
         str: The constructed query description.
     """
-    query_description = ''
+    parts = []
     if protocol_document is not None:
-        query_description += 'Protocol document:\n\n'
-        query_description += protocol_document + '\n\n'
+        parts.extend(['Protocol document:\n\n', protocol_document, '\n\n'])
 
     task_schema = TaskSchema.from_taskschemalike(task_schema).to_json()
-    query_description += 'JSON schema of the task:\n\n'
-    query_description += 'Input (i.e. what the machine will provide you):\n'
-    query_description += json.dumps(task_schema['input_schema'], indent=2) + '\n\n'
-    query_description += 'Output (i.e. what you have to provide to the machine):\n'
-    query_description += json.dumps(task_schema['output_schema'], indent=2) + '\n\n'
-    query_description += 'JSON data of the task:\n\n'
-    query_description += json.dumps(task_data, indent=2) + '\n\n'
-
-    return query_description
+    parts.extend([
+        'JSON schema of the task:\n\n',
+        'Input (i.e. what the machine will provide you):\n',
+        json.dumps(task_schema['input_schema'], indent=2), '\n\n',
+        'Output (i.e. what you have to provide to the machine):\n',
+        json.dumps(task_schema['output_schema'], indent=2), '\n\n',
+        'JSON data of the task:\n\n',
+        json.dumps(task_data, indent=2), '\n\n'
+    ])
+
+    return ''.join(parts)
 
 NL_QUERIER_PROMPT = 'You are NaturalLanguageQuerierGPT. You act as an intermediary between a machine (which has a very specific input and output schema) and an agent (who uses natural language).' \
     'You will receive a task description (including a schema of the input and output that the machine uses) and the corresponding data. Call the \"send_query\" tool with a natural language message where you ask to perform the task according to the data.' \
@@ -77,8 +81,7 @@ def parse_and_handle_query(query: str, callback: Callable[[str], Dict]) -> str:
     except ProtocolRejectedError:
         raise
     except Exception as e:
-        # import traceback
-        # traceback.print_exc()
+        logger.debug('Error calling the tool', exc_info=True)
         return 'Error calling the tool: ' + str(e)
 
 class Querier:
@@ -125,7 +128,7 @@ class Querier:
         query_counter = 0
 
         def send_query_internal(query):
-            # print('Sending query:', query)
+            logger.debug('Sending query: %s', query)
             nonlocal query_counter
             query_counter += 1
 
@@ -153,7 +156,7 @@ class Querier:
         found_error = None
 
         def register_output(**kwargs) -> str:
-            # print('Registering output:', kwargs)
+            logger.debug('Registering output: %s', kwargs)
 
             nonlocal found_output
 
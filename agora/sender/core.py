@@ -1,4 +1,5 @@
 import inspect
+import logging
 from typing import Any, Optional
 
 from agora.common.core import Protocol
@@ -12,13 +13,15 @@ from agora.sender.components.querier import Querier
 from agora.sender.components.transporter import SenderTransporter, SimpleSenderTransporter
 from agora.common.executor import Executor, RestrictedExecutor
 
-from agora.common.toolformers.base import Tool
+from agora.common.toolformers.base import Tool, Toolformer
 
 from agora.sender.memory import SenderMemory
 from agora.sender.schema_generator import TaskSchemaGenerator
 
 from agora.utils import encode_as_data_uri
 
+logger = logging.getLogger(__name__)
+
 class Sender:
     """
     Main Sender class responsible for orchestrating protocols, components, and memory.
@@ -75,7 +78,8 @@ class Sender:
         storage_path: str = './.agora/storage/sender.json',
         protocol_threshold: int = 5,
         negotiation_threshold: int = 10,
-        implementation_threshold: int = 5
+        implementation_threshold: int = 5,
+        cheap_toolformer: Optional[Toolformer] = None
     ):
         """Create a default Sender instance with optional custom components.
 
@@ -92,6 +96,7 @@ class Sender:
             protocol_threshold (int, optional): Minimum number of conversations to check existing protocols and see if one is suitable. Defaults to 5.
             negotiation_threshold (int, optional): Minimum number of conversations to negotiate a new protocol. Defaults to 10.
             implementation_threshold (int, optional): Minimum number of conversations using a protocol to write an implementation. Defaults to 5.
+            cheap_toolformer (Toolformer, optional): A cheaper/faster toolformer (e.g. a "mini" model) used for the YES/NO protocol checks. Defaults to None (use toolformer).
 
         Returns:
             Sender: A configured Sender instance.
@@ -100,8 +105,11 @@ class Sender:
             storage = JSONStorage(storage_path)
         memory = SenderMemory(storage)
 
+        if cheap_toolformer is None:
+            cheap_toolformer = toolformer
+
         if protocol_picker is None:
-            protocol_picker = ProtocolPicker(toolformer)
+            protocol_picker = ProtocolPicker(cheap_toolformer)
         if negotiator is None:
             negotiator = SenderNegotiator(toolformer)
         if programmer is None:
@@ -129,7 +137,7 @@ class Sender:
         with self.transporter.new_conversation(target, True, 'negotiation', None) as external_conversation:
             def send_query(query):
                 response = external_conversation(query)
-                # print('Response to negotiator:', response)
+                logger.debug('Response to negotiator: %s', response)
                 return response
 
             protocol = self.negotiator(task_schema, send_query)
@@ -211,7 +219,7 @@ class Sender:
             """
 
             response = callback(query)
-            # print('Tool run_routine responded with:', response)
+            logger.debug('Tool run_routine responded with: %s', response)
             return response['body']
 
         send_query_tool = Tool.from_function(send_to_server) # TODO: Handle errors
@@ -265,7 +273,7 @@ class Sender:
         ) as external_conversation:
             def send_query(query):
                 response = external_conversation(query)
-                # print('Response to sender:', response)
+                logger.debug('Response to sender: %s', response)
                 return response
 
             implementation = None
@@ -279,8 +287,7 @@ class Sender:
                 try:
                     response = self._run_routine(protocol.hash, implementation, task_data, send_query)
                 except ExecutionError as e:
-                    # print('Error running routine:', e)
-                    # print('Fallback to querier')
+                    logger.info('Error running routine, falling back to querier: %s', e)
 
                     response = self.querier(task_schema, task_data, protocol.protocol_document if protocol else None, send_query)
 
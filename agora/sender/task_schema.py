@@ -1,4 +1,5 @@
 from collections.abc import Mapping
+import functools
 import json
 from typing import Callable, Optional, TypeAlias, TYPE_CHECKING
 
@@ -9,7 +10,10 @@ if TYPE_CHECKING:
     from agora.sender.schema_generator import TaskSchemaGenerator
 
 class TaskSchema(Mapping):
-    """Defines the schema for a task, including description and input/output schemas."""
+    """Defines the schema for a task, including description and input/output schemas.
+
+    The JSON serialization is computed once and memoized, so a TaskSchema should not be modified after it has been serialized.
+    """
 
     def __init__(
         self,
@@ -141,6 +145,16 @@ class TaskSchema(Mapping):
         else:
             raise SchemaError('TaskSchemaLike must be either a TaskSchema or a dict')
 
+    @functools.cached_property
+    def serialized_json(self) -> str:
+        """
+        The indented JSON serialization of the TaskSchema, computed once.
+
+        Returns:
+            str: The JSON-formatted string of the TaskSchema.
+        """
+        return json.dumps(self.to_json(), indent=2)
+
     def __str__(self) -> str:
         """
         Returns the JSON string representation of the TaskSchema.
@@ -148,6 +162,6 @@ class TaskSchema(Mapping):
         Returns:
             str: The JSON-formatted string of the TaskSchema.
         """
-        return json.dumps(self.to_json(), indent=2)
+        return self.serialized_json
 
 TaskSchemaLike : TypeAlias = TaskSchema | dict
\ No newline at end of file
@@ -1,10 +1,29 @@
 import base64
+import functools
 import hashlib
+import importlib
+import logging
+import re
 import requests
 import urllib.parse
 
 import yaml
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def _compile_tag_pattern(start_tag: str, end_tag: str) -> re.Pattern:
+    """Compiles (once per pair of tags) a case-insensitive pattern matching the text between two tags.
+
+    Args:
+        start_tag (str): The beginning delimiter.
+        end_tag (str): The ending delimiter.
+
+    Returns:
+        re.Pattern: The compiled pattern. Group 1 contains the text between the tags.
+    """
+    return re.compile(re.escape(start_tag) + '(.*?)' + re.escape(end_tag), re.DOTALL | re.IGNORECASE)
 
 def extract_substring(text: str, start_tag: str, end_tag: str, include_tags=True) -> Optional[str]:
     """Extracts a substring from the given text, bounded by start_tag and end_tag.
@@ -19,15 +38,14 @@ def extract_substring(text: str, start_tag: str, end_tag: str, include_tags=True
     Returns:
         Optional[str]: The extracted substring or None if not found.
     """
-    start_position = text.lower().find(start_tag.lower())
-    end_position = text.lower().find(end_tag.lower(), start_position + len(start_tag))
+    match = _compile_tag_pattern(start_tag, end_tag).search(text)
 
-    if start_position == -1 or end_position == -1:
+    if match is None:
         return None
-    
+
     if include_tags:
-        return text[start_position:end_position + len(end_tag)].strip()
-    return text[start_position + len(start_tag):end_position].strip()
+        return match.group(0).strip()
+    return match.group(1).strip()
 
 def compute_hash(s: str) -> str:
     """Computes a hash of the given string.
@@ -45,6 +63,25 @@ def compute_hash(s: str) -> str:
 
     return base64.b64encode(b).decode('ascii')
 
+def compute_cache_key(*parts: str) -> str:
+    """Computes a content-addressed key from one or more strings.
+
+    Args:
+        *parts (str): The strings that identify the cached content.
+
+    Returns:
+        str: The resulting key as a hexadecimal string.
+    """
+    m = hashlib.blake2b()
+
+    for part in parts:
+        encoded = part.encode()
+        # Length-prefix each part, so that different splits of the same text have different keys
+        m.update(len(encoded).to_bytes(8, 'big'))
+        m.update(encoded)
+
+    return m.hexdigest()
+
 def extract_metadata(text: str) -> dict:
     """Extracts metadata from the given text in YAML format.
 
@@ -97,7 +134,7 @@ def download_and_verify_protocol(protocol_hash: str, protocol_source: str, timeo
         elif protocol_source.startswith('data:text/plain;charset=utf-8,'):
             protocol = urllib.parse.unquote(protocol_source[len('data:text/plain;charset=utf-8,'):])
         else:
-            # print('Unsupported data URI:', protocol_source)
+            logger.debug('Unsupported data URI: %s', protocol_source)
             return None
     else:
         response = requests.get(protocol_source, timeout=timeout)
@@ -105,12 +142,38 @@ def download_and_verify_protocol(protocol_hash: str, protocol_source: str, timeo
         if response.status_code == 200:
             protocol = response.text
         else:
-            # print('Failed to download protocol from', protocol_source)
+            logger.debug('Failed to download protocol from %s', protocol_source)
             return None
 
     # Check if the hash matches
     if compute_hash(protocol) == protocol_hash:
         return protocol
 
-    # print('Protocol does not match hash:', protocol_source)
+    logger.debug('Protocol does not match hash: %s', protocol_source)
     return None
+
+def lazy_module_getattr(module_name: str, lazy_attributes: Dict[str, Tuple[str, Optional[str]]]) -> Callable[[str], Any]:
+    """Creates a module-level __getattr__ (PEP 562) that imports attributes on first access.
+
+    Args:
+        module_name (str): The name of the module that will use the __getattr__.
+        lazy_attributes (Dict[str, Tuple[str, Optional[str]]]): Maps each attribute name to the module that
+            defines it and the name of the attribute within that module. If the latter is None, the
+            module itself is returned.
+
+    Returns:
+        Callable[[str], Any]: The __getattr__ function.
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_attributes:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+
+        source_module_name, attribute_name = lazy_attributes[name]
+        source_module = importlib.import_module(source_module_name)
+        value = source_module if attribute_name is None else getattr(source_module, attribute_name)
+
+        # Cache the value in the module, so that __getattr__ is not called again
+        setattr(importlib.import_module(module_name), name, value)
+        return value
+
+    return __getattr__